@@ -16,26 +16,32 @@ Design notes:
   and a seeded RNG to generate scene text and adaptive choices that *matter*.
 - Your decisions shift state variables (trust, morality, power, notoriety, etc.)
   which unlock/lock scenes and endings. Multiple playthroughs will diverge.
-- No external libraries or internet are needed.
+- No external libraries or internet are needed (orjson speeds up saves if installed).
 """
 from __future__ import annotations
 from textwrap import dedent  # ensure dedent is available at runtime
 import os
+import atexit
 import sys
-import json
+import copy
 import time
+import queue
 import random
-import shutil
-import hashlib
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Tuple, Optional
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields
+from typing import List, Dict, Tuple, Optional, Sequence
+
+try:
+    import orjson as _json_fast  # optional: faster save encoding when installed
+except ImportError:
+    _json_fast = None
 
 SAVE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "saves")
 NUM_SLOTS = 8
 
-def ascii_title() -> str:
-    # Simple clean ASCII header. Fixed-width and safe for terminals.
-    return r"""
+# Simple clean ASCII header. Fixed-width and safe for terminals.
+_ASCII_TITLE = r"""
  ██╗░░░██╗░█████╗░██╗░░░██╗██╗██████╗░███████╗  ░██████╗  ██╗  ░█████╗░  ██╗░░██╗
 ╚██╗░██╔╝██╔══██╗██║░░░██║╚█║██╔══██╗██╔════╝  ██╔════╝  ██║  ██╔══██╗  ██║░██╔╝
 ░╚████╔╝░██║░░██║██║░░░██║░╚╝██████╔╝█████╗░░  ╚█████╗░  ██║  ██║░░╚═╝  █████═╝░
@@ -47,7 +53,8 @@ def ascii_title() -> str:
 
 # ---------- Data Structures ----------
 
-@dataclass
+# __slots__ storage where supported (Python 3.10+); a plain dataclass otherwise
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class StoryState:
     name: str = "Nameless"
     chapter: int = 0
@@ -62,16 +69,59 @@ class StoryState:
     flags: Dict[str, bool] = field(default_factory=dict)
     history: List[str] = field(default_factory=list)
     seed: int = 0
+    # Saved random.Random position as [version, internal state, gauss_next];
+    # None for new games and for saves made before it was recorded.
+    rng_state: Optional[List] = None
+    # Cached flags["demon_lord_name"]; the name never changes once chosen
+    _dl_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def demon_lord_name(self) -> str:
+        name = self._dl_name
+        if name is None:
+            name = self.flags.get("demon_lord_name")
+            if name is None:
+                return "the Demon Lord"
+            self._dl_name = name
+        return name
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Shallow on purpose: saves serialize the result immediately, so the
+        # deep copy asdict() makes of inventory/flags/history is wasted work.
+        return {
+            "name": self.name,
+            "chapter": self.chapter,
+            "location": self.location,
+            "health": self.health,
+            "power": self.power,
+            "morality": self.morality,
+            "notoriety": self.notoriety,
+            "trust_demon_lord": self.trust_demon_lord,
+            "bond_demon_lord": self.bond_demon_lord,
+            "inventory": self.inventory,
+            "flags": self.flags,
+            "history": self.history,
+            "seed": self.seed,
+            "rng_state": self.rng_state,
+        }
+
+    def capture_rng(self, rng: random.Random):
+        version, internal, gauss_next = rng.getstate()
+        self.rng_state = [version, list(internal), gauss_next]
+
+    def restore_rng(self, rng: random.Random):
+        """Resume rng where this state was saved; older saves fall back to reseeding."""
+        if self.rng_state is None:
+            rng.seed(self.seed)
+            return
+        version, internal, gauss_next = self.rng_state
+        rng.setstate((version, tuple(internal), gauss_next))
 
     @staticmethod
     def from_dict(d: Dict) -> "StoryState":
         # Maintain forward-compat by providing defaults
-        defaults = StoryState()
-        for k, v in defaults.to_dict().items():
-            d.setdefault(k, v)
+        for f in fields(StoryState):
+            if f.init and f.name not in d:
+                d[f.name] = f.default_factory() if f.default_factory is not MISSING else f.default
         # Ensure types
         d["inventory"] = list(d.get("inventory", []))
         d["flags"] = dict(d.get("flags", {}))
@@ -85,11 +135,18 @@ class SaveManager:
         self.save_dir = save_dir
         self.num_slots = num_slots
         os.makedirs(self.save_dir, exist_ok=True)
+        # Background saves: the game loop hands off a snapshot and goes straight
+        # back to reading input while encoding and disk writes happen here.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="save")
+        self._pending: Dict[int, Future] = {}
+        # Pending saves must reach disk even if the game exits (or is interrupted) right after
+        atexit.register(self.close)
 
     def slot_path(self, slot: int) -> str:
         return os.path.join(self.save_dir, f"slot_{slot}.json")
 
-    def save(self, slot: int, state: StoryState) -> str:
+    def save(self, slot: int, state: StoryState, pretty: bool = False) -> str:
+        import json  # imported on first use to keep game startup lean
         if slot < 1 or slot > self.num_slots:
             raise ValueError(f"Slot must be between 1 and {self.num_slots}.")
         path = self.slot_path(slot)
@@ -98,11 +155,69 @@ class SaveManager:
             "timestamp": int(time.time()),
             "state": state.to_dict(),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if _json_fast is not None:
+            payload = _json_fast.dumps(data, option=_json_fast.OPT_INDENT_2 if pretty else 0)
+        elif pretty:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            # Compact output keeps the encoder on its C fast path
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        # Write and fsync a temp file, then rename it over the slot, so a crash
+        # leaves either the old save or the new one, never a torn file.
+        # Interactive saves run this on the save pool, off the input thread.
+        tmp = path + ".tmp"
+        with open(tmp, "wb", buffering=1 << 16) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
         return path
 
+    def save_async(self, slot: int, state: StoryState, pretty: bool = False) -> Future:
+        """Save a snapshot of state in the background; the future resolves to the slot path."""
+        if slot < 1 or slot > self.num_slots:
+            raise ValueError(f"Slot must be between 1 and {self.num_slots}.")
+        # Two writers on one slot would share a temp file, so finish the earlier
+        # save first. Its outcome was already reported through its own future.
+        prev = self._pending.get(slot)
+        if prev is not None:
+            prev.exception()
+        snapshot = copy.deepcopy(state)
+        fut = self._pool.submit(self.save, slot, snapshot, pretty)
+        self._pending[slot] = fut
+        return fut
+
+    def prefetch(self):
+        """Warm the OS cache for every slot file in the background, ahead of load()."""
+        for s in range(1, self.num_slots + 1):
+            self._pool.submit(self._warm, self.slot_path(s))
+
+    @staticmethod
+    def _warm(path: str):
+        try:
+            with open(path, "rb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    f.read()
+        except OSError:
+            pass
+
+    def join(self):
+        """Block until every pending background save has finished."""
+        for fut in list(self._pending.values()):
+            fut.exception()
+        self._pending.clear()
+
+    def close(self):
+        """Finish pending saves and stop the save threads."""
+        self.join()
+        self._pool.shutdown()
+        atexit.unregister(self.close)
+
     def load(self, slot: int) -> StoryState:
+        import json
+        self.join()
         path = self.slot_path(slot)
         if not os.path.exists(path):
             raise FileNotFoundError(f"No save found in slot {slot}.")
@@ -112,33 +227,393 @@ class SaveManager:
         return state
 
     def list_saves(self) -> List[Tuple[int, str]]:
+        self.join()
+        # One directory scan finds every slot file at once, instead of probing
+        # each slot path (most of which usually don't exist) one by one.
+        try:
+            with os.scandir(self.save_dir) as it:
+                entries = {e.name: e for e in it}
+        except OSError:
+            return []
         result = []
         for s in range(1, self.num_slots + 1):
-            path = self.slot_path(s)
-            if os.path.exists(path):
-                ts = "<unknown>"
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(data.get("timestamp", 0)))
-                except Exception:
-                    pass
-                result.append((s, ts))
+            entry = entries.get(os.path.basename(self.slot_path(s)))
+            if entry is None:
+                continue
+            # The file's mtime is the save time; no need to parse the JSON for it
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            result.append((s, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))))
         return result
 
+# ---------- Scene Templates ----------
+
+# Scene text and choices are fixed apart from the Demon Lord's name, which is
+# spliced in with a single "%s" substitution.
+
+_TENSE_CAMP_TEXT = (
+    "A small fire sputters beneath twisted pines. %s watches you from across the flames.\n"
+    "Trust flickers like kindling. The forest listens."
+)
+_TENSE_CAMP_CHOICES = (
+    ("Share a painful memory to earn her empathy.", "camp_confide"),
+    ("Hone your blade in silence; let actions speak.", "camp_silence"),
+    ("Probe her motives—why rule the demons at all?", "camp_probe"),
+    ("Scout the perimeter; danger stalks the dark.", "camp_scout"),
+)
+
+_TRAINING_TEXT = (
+    "In the Obsidian Glade, %s tests you. Demonic sigils fracture the air.\n"
+    "Power strains your scars as you push beyond mortal limits."
+)
+_TRAINING_CHOICES = (
+    ("Master a defensive ward to shield the weak.", "train_defense"),
+    ("Channel wrath—strike harder, faster, crueler.", "train_wrath"),
+)
+_TRAINING_SYNC_CHOICE = "Synchronize with %s's rhythm; trust the dance of blades."
+
+_COUNCIL_TEXT = (
+    "%s's lieutenants argue under lanterns filled with captured starlight.\n"
+    "War or peace? Retaliation or secrecy? They seek your counsel."
+)
+_COUNCIL_CHOICES = (
+    ("Advise diplomacy—seek proof of the kingdom's treachery.", "council_diplomacy"),
+    ("Plan raids on corrupt nobles and supply lines.", "council_raids"),
+    ("Propose a secret parley with a sympathetic hero.", "council_parley"),
+)
+
+_OATH_BOND_TEXT = (
+    "Beside the Moonwell, %s offers her hand. \"We choose each other—against crown and fate.\"\n"
+    "The water reflects futures you barely recognize."
+)
+_OATH_BOND_CHOICES = (
+    ("Swear an oath of alliance.", "oath_sworn"),
+    ("Hesitate—the cost of vows is always hidden.", "oath_hesitate"),
+    ("Refuse—freedom above all.", "oath_refuse"),
+)
+
+_SPY_REPORT_TEXT = (
+    "A demon scout kneels, breathless: the kingdom moves hunters into the forest.\n"
+    "They bear your crest—bait for a public execution."
+)
+_SPY_REPORT_CHOICES = (
+    ("Intercept and expose the ruse.", "spy_intercept"),
+    ("Turn the ambush onto the hunters.", "spy_reverse"),
+    ("Ignore; focus on power first.", "spy_ignore"),
+)
+
+_AMBUSH_TEXT = (
+    "You spot royal scouts across a broken bridge, whispering your name like a curse.\n"
+    "Their signal mirrors glint. A choice, sharp as shale."
+)
+_AMBUSH_CHOICES = (
+    ("Strike from shadow—no witnesses.", "ambush_shadow"),
+    ("Seize a scout alive for information.", "ambush_capture"),
+    ("Let them flee; plant fear and rumor.", "ambush_letgo"),
+)
+
+_RESCUE_TEXT = (
+    "A caravan of refugees stumbles under the weight of injustice. Bandits circle.\n"
+    "You hear a child's cough beneath the wind."
+)
+_RESCUE_CHOICES = (
+    ("Shield the caravan; take the blows for them.", "rescue_shield"),
+    ("Outwit the bandits with a ruse.", "rescue_ruse"),
+    ("Walk away. Mercy is a luxury.", "rescue_walk"),
+)
+
+_GRIM_BARGAIN_TEXT = (
+    "A thorned altar hums with forbidden strength. %s's gaze is unreadable.\n"
+    "The altar grants might… and takes what you value most."
+)
+_GRIM_BARGAIN_CHOICES = (
+    ("Bleed for power: sacrifice a memory.", "bargain_memory"),
+    ("Spare yourself—reject the altar.", "bargain_reject"),
+    ("Offer the altar a token from your betrayers.", "bargain_token"),
+)
+
+_RUINS_TEXT = (
+    "Fog curls around cracked archways. Glyphs speak of heroes who burned their own ages ago.\n"
+    "A vault door breathes cold secrets."
+)
+_RUINS_CHOICES = (
+    ("Study the glyphs for hidden history.", "ruins_study"),
+    ("Force the vault—whatever lies within is yours.", "ruins_force"),
+    ("Leave a mark: a promise to return stronger.", "ruins_mark"),
+)
+
+_WILD_HUNT_TEXT = (
+    "Horns sound. Spectral riders rise like storm-surf, seeking a worthy quarry.\n"
+    "They circle, inviting chase or challenge."
+)
+_WILD_HUNT_CHOICES = (
+    ("Race with them; learn their paths.", "hunt_race"),
+    ("Challenge the huntmaster to single combat.", "hunt_duel"),
+    ("Hide and observe; knowledge first.", "hunt_hide"),
+)
+
+_WHISPERS_TEXT = (
+    "Leaves speak in voices you once trusted. They tell different truths now.\n"
+    "One whisper carries the name of a hero who betrayed you."
+)
+_WHISPERS_CHOICES = (
+    ("Follow the whisper to its source.", "whisper_follow"),
+    ("Silence the voices with a ward.", "whisper_ward"),
+)
+_WHISPERS_TOGETHER_CHOICE = "Ask %s to listen with you."
+
+# ---------- Choice Effects ----------
+
+# Choice tag -> effects & narration snippet, looked up once per choice.
+#   deltas:  (attr, delta, lo, hi) stat changes, each clamped to [lo, hi]
+#   flags:   flags to set on the state
+#   history: entry appended to the story history
+#   item:    inventory item gained (kept unique)
+#   text:    continuation text; "{dl}" is replaced with the Demon Lord's name
+_EFFECTS: Dict[str, Dict] = {
+    # Intro
+    "intro_plead": {
+        "deltas": (("morality", +10, -100, 100), ("trust_demon_lord", +15, 0, 100)),
+        "flags": {"seeking_truth": True},
+        "text": "You speak plainly of betrayal. {dl} studies the cracks in your voice and lowers her hand. \"Truth cuts deeper than any blade,\" she says.",
+    },
+    "intro_vengeance": {
+        "deltas": (("morality", -10, -100, 100), ("power", +10, 0, 100), ("trust_demon_lord", +5, 0, 100)),
+        "flags": {"vow_revenge": True},
+        "text": "Vengeance burns like pitch. {dl} smiles—a small, dangerous thing. \"Then we understand each other.\"",
+    },
+    "intro_pact": {
+        "deltas": (("trust_demon_lord", +20, 0, 100),),
+        "flags": {"allied": True},
+        "text": "You offer terms, not supplication. {dl} clasps your wrist. \"We hunt different prey—but we can share the trail.\"",
+    },
+    "intro_fight": {
+        # Respect through defiance
+        "deltas": (("health", -15, 0, 100), ("power", +5, 0, 100), ("trust_demon_lord", +10, 0, 100)),
+        "text": "Steel rings. You draw blood and pay in kind. {dl} laughs like thunder far away. \"Live, then. Earn the right to stand.\"",
+    },
+
+    # Camp
+    "camp_confide": {
+        "deltas": (("morality", +5, -100, 100), ("trust_demon_lord", +12, 0, 100)),
+        "text": "Your memory is a splinter. You let it out. {dl} listens without mercy—without judgment. The fire warms, just a little.",
+    },
+    "camp_silence": {
+        "deltas": (("power", +5, 0, 100), ("trust_demon_lord", +2, 0, 100)),
+        "text": "You sharpen steel and silence. Sparks chart constellations no map has named.",
+    },
+    "camp_probe": {
+        "deltas": (("trust_demon_lord", -3, 0, 100), ("notoriety", +5, 0, 100)),
+        "text": "Questions are knives. {dl} answers some and turns aside others. You learn enough to be wary—and useful.",
+    },
+    "camp_scout": {
+        "deltas": (("power", +3, 0, 100), ("health", +3, 0, 100)),
+        "text": "You pace the warding ring. Footprints. A bent reed. The forest is a chessboard and you are learning the moves.",
+    },
+
+    # Training
+    "train_defense": {
+        "deltas": (("power", +7, 0, 100), ("morality", +5, -100, 100), ("trust_demon_lord", +5, 0, 100)),
+        "text": "Your ward blooms like a quiet star. It holds when claws descend. Somewhere, someone will live because of this.",
+    },
+    "train_wrath": {
+        "deltas": (("power", +12, 0, 100), ("morality", -6, -100, 100), ("notoriety", +6, 0, 100)),
+        "text": "You inhale the storm and exhale ruin. The stones remember your name as a crack.",
+    },
+    "train_sync": {
+        "deltas": (("power", +6, 0, 100), ("trust_demon_lord", +10, 0, 100), ("bond_demon_lord", +1, 0, 100)),
+        "text": "Step, strike, breathe—together. {dl}'s motion becomes a language you begin to read.",
+    },
+
+    # Council
+    "council_diplomacy": {
+        "deltas": (("morality", +8, -100, 100), ("trust_demon_lord", +6, 0, 100)),
+        "flags": {"seeking_truth": True},
+        "text": "You chart a path of proof and patience. The hall quiets; even war can listen.",
+    },
+    "council_raids": {
+        "deltas": (("power", +8, 0, 100), ("notoriety", +10, 0, 100)),
+        "flags": {"vow_revenge": True},
+        "text": "Targets line the map like sins. You thread a needle through them made of fire.",
+    },
+    "council_parley": {
+        "deltas": (("morality", +3, -100, 100), ("notoriety", +3, 0, 100)),
+        "flags": {"parley_set": True},
+        "text": "A secret parley—dangerous, delicate. If it holds, the story changes.",
+    },
+
+    # Oath
+    "oath_sworn": {
+        "deltas": (("trust_demon_lord", +20, 0, 100), ("bond_demon_lord", +3, 0, 100)),
+        "flags": {"oath_bound": True},
+        "text": "You swear by fang and star. The Moonwell seals the promise with a chill that tastes like dawn.",
+    },
+    "oath_hesitate": {
+        "deltas": (("trust_demon_lord", -5, 0, 100),),
+        "text": "You ask for time. The Moonwell reflects two strangers trying to be allies.",
+    },
+    "oath_refuse": {
+        "deltas": (("trust_demon_lord", -12, 0, 100),),
+        "flags": {"allied": False},
+        "text": "You step back from the brink. Freedom is a lonely country.",
+    },
+
+    # Spies & Ambush
+    "spy_intercept": {
+        "deltas": (("morality", +4, -100, 100), ("notoriety", +5, 0, 100)),
+        "text": "You unmask the trap and free the bait. Rumors begin to turn toward truth.",
+    },
+    "spy_reverse": {
+        "deltas": (("power", +7, 0, 100), ("morality", -2, -100, 100), ("notoriety", +9, 0, 100)),
+        "text": "Hunters become the hunted. The forest keeps your secrets.",
+    },
+    "spy_ignore": {
+        "deltas": (("power", +4, 0, 100), ("morality", -4, -100, 100)),
+        "text": "You let the game play on without you—for now.",
+    },
+
+    "ambush_shadow": {
+        "deltas": (("power", +8, 0, 100), ("morality", -6, -100, 100), ("notoriety", +8, 0, 100)),
+        "text": "No witnesses. No mercy. The bridge remembers only silence.",
+    },
+    "ambush_capture": {
+        "deltas": (("morality", +6, -100, 100), ("notoriety", +4, 0, 100)),
+        "text": "Under your blade, a scout chooses life—and answers. Names spill like beads from a torn chain.",
+    },
+    "ambush_letgo": {
+        "deltas": (("morality", +2, -100, 100), ("notoriety", +6, 0, 100)),
+        "text": "Mercy travels faster than hoofbeats. Fear travels faster still.",
+    },
+
+    # Rescue
+    "rescue_shield": {
+        "deltas": (("morality", +10, -100, 100), ("health", -8, 0, 100), ("trust_demon_lord", +4, 0, 100)),
+        "text": "You take the blows others could not bear. A child's cough becomes a laugh.",
+    },
+    "rescue_ruse": {
+        "deltas": (("morality", +6, -100, 100), ("power", +3, 0, 100)),
+        "text": "Illusions, footprints, a staged cry—bandits chase ghosts while the caravan slips free.",
+    },
+    "rescue_walk": {
+        "deltas": (("morality", -10, -100, 100), ("power", +4, 0, 100), ("notoriety", +5, 0, 100)),
+        "text": "You turn away. The road learns your name without deciding if it loves you.",
+    },
+
+    # Grim bargain
+    "bargain_memory": {
+        "deltas": (("power", +15, 0, 100), ("morality", -8, -100, 100)),
+        "history": "You traded a cherished memory at the Thorn Altar.",
+        "text": "You give the altar a memory of home. Power rushes in to fill the hollow it leaves.",
+    },
+    "bargain_reject": {
+        "deltas": (("morality", +5, -100, 100), ("trust_demon_lord", +3, 0, 100)),
+        "text": "You walk away from easy strength. The altar hums, disappointed.",
+    },
+    "bargain_token": {
+        "deltas": (("power", +10, 0, 100), ("notoriety", +7, 0, 100)),
+        "text": "You place a betrayer's token on the altar. The thorns drink deep and answer with power.",
+    },
+
+    # Ruins
+    "ruins_study": {
+        "deltas": (("power", +4, 0, 100), ("morality", +2, -100, 100)),
+        "history": "Discovered records of prior heroes consumed by their crowns.",
+        "text": "Glyphs confess: heroes burned an age to keep a throne warm. Truth is an ember you pocket.",
+    },
+    "ruins_force": {
+        "deltas": (("power", +8, 0, 100), ("morality", -4, -100, 100)),
+        "item": "Vault Relic",
+        "text": "The vault yields with a scream of stone. Inside waits a relic that knows your pulse.",
+    },
+    "ruins_mark": {
+        "deltas": (("morality", +1, -100, 100), ("trust_demon_lord", +2, 0, 100)),
+        "text": "You leave a mark, not a wound. Even ruins deserve a future.",
+    },
+
+    # Wild Hunt
+    "hunt_race": {
+        "deltas": (("power", +5, 0, 100), ("notoriety", +3, 0, 100)),
+        "text": "You run with ghosts until your lungs are bells. They teach you shortcuts through moonlight.",
+    },
+    "hunt_duel": {
+        "deltas": (("power", +10, 0, 100), ("health", -6, 0, 100), ("notoriety", +6, 0, 100)),
+        "text": "Steel rings against antler and oath. You win a scar and a salute.",
+    },
+    "hunt_hide": {
+        "deltas": (("morality", +2, -100, 100),),
+        "text": "You watch unseen as the Wild Hunt redraws the night's borders.",
+    },
+
+    # Whispers
+    "whisper_follow": {
+        "deltas": (("notoriety", +4, 0, 100),),
+        "flags": {"betrayer_trail": True},
+        "text": "The whisper leads to a sigil cut in bark: a hero's mark. The trail warms under your gaze.",
+    },
+    "whisper_ward": {
+        "deltas": (("power", +3, 0, 100), ("morality", +1, -100, 100)),
+        "text": "You hush the forest with a ward that tastes like peppermint and thunder.",
+    },
+    "whisper_together": {
+        "deltas": (("trust_demon_lord", +8, 0, 100), ("bond_demon_lord", +1, 0, 100)),
+        "text": "You and {dl} listen as one. The voices braid into a map only two can read.",
+    },
+}
+
 # ---------- Narrative Engine ----------
 
+# Relative odds of each scene archetype once it is available. Tune these to
+# make scenes rarer or more common without touching the availability rules.
+_ARCHETYPE_WEIGHTS: Dict[str, float] = {
+    "oath_bond": 0.4,
+    "council": 1.0,
+    "training": 1.0,
+    "tense_camp": 1.2,
+    "spy_report": 1.0,
+    "ambush_king_scouts": 0.8,
+    "rescue_travelers": 1.0,
+    "grim_bargain": 0.8,
+    "mystic_ruins": 1.0,
+    "wild_hunt": 0.8,
+    "whispering_trees": 1.2,
+}
+
 class StoryEngine:
+    # Scene archetypes that depend on state: (name, availability predicate, weight)
+    _ARCHETYPES = tuple((name, available, _ARCHETYPE_WEIGHTS[name]) for name, available in (
+        # Relationship scenes
+        ("oath_bond", lambda st: st.flags.get("met_demon_lord", False) and st.trust_demon_lord >= 60 and not st.flags.get("oath_bound", False)),
+        ("council", lambda st: st.flags.get("met_demon_lord", False) and st.trust_demon_lord >= 30),
+        ("training", lambda st: st.flags.get("met_demon_lord", False) and st.trust_demon_lord >= 30),
+        ("tense_camp", lambda st: st.flags.get("met_demon_lord", False) and st.trust_demon_lord < 30),
+        # External plot
+        ("spy_report", lambda st: st.flags.get("vow_revenge", False)),
+        ("ambush_king_scouts", lambda st: st.flags.get("vow_revenge", False)),
+        ("rescue_travelers", lambda st: st.morality >= 40),
+        ("grim_bargain", lambda st: st.morality <= -40),
+    ))
+    # General exploration, always available
+    _ALWAYS_NAMES = ("mystic_ruins", "wild_hunt", "whispering_trees")
+    _ALWAYS_WEIGHTS = tuple(_ARCHETYPE_WEIGHTS[name] for name in _ALWAYS_NAMES)
+
     def __init__(self, rng: random.Random):
         self.rng = rng
-
-    # Utility clamps
-    @staticmethod
-    def clamp(v: int, lo: int, hi: int) -> int:
-        return max(lo, min(hi, v))
-
-    def _p(self, p_true: float) -> bool:
-        return self.rng.random() < p_true
+        # Archetype name -> scene builder, built once instead of an if-chain per scene
+        self._dispatch = {
+            "oath_bond": self.scene_oath_bond,
+            "council": self.scene_council,
+            "training": self.scene_training,
+            "tense_camp": self.scene_tense_camp,
+            "spy_report": self.scene_spy_report,
+            "ambush_king_scouts": self.scene_ambush,
+            "rescue_travelers": self.scene_rescue,
+            "grim_bargain": self.scene_grim_bargain,
+            "mystic_ruins": self.scene_ruins,
+            "wild_hunt": self.scene_wild_hunt,
+            "whispering_trees": self.scene_whispers,
+        }
 
     def intro_scene(self, st: StoryState) -> Tuple[str, List[Tuple[str, str]]]:
         st.chapter = 1
@@ -169,382 +644,107 @@ class StoryEngine:
         ]
         return text, choices
 
-    def generate_scene(self, st: StoryState) -> Tuple[str, List[Tuple[str, str]]]:
+    def generate_scene(self, st: StoryState) -> Tuple[str, Sequence[Tuple[str, str]]]:
         """Return (paragraph, choices[(text, tag)...]) based on state."""
         # First special scenes based on flags & arcs:
         if st.chapter == 0:
             return self.intro_scene(st)
 
         # Possible scene archetypes depending on state
-        archetypes = []
+        names = list(self._ALWAYS_NAMES)
+        weights = list(self._ALWAYS_WEIGHTS)
+        for name, available, weight in self._ARCHETYPES:
+            if available(st):
+                names.append(name)
+                weights.append(weight)
 
-        # Relationship scenes
-        if st.flags.get("met_demon_lord", False):
-            if st.trust_demon_lord >= 60 and not st.flags.get("oath_bound", False):
-                archetypes += ["oath_bond"]
-            if st.trust_demon_lord >= 30:
-                archetypes += ["council", "training"]
-            else:
-                archetypes += ["tense_camp"]
-        # External plot
-        if st.flags.get("vow_revenge", False):
-            archetypes += ["spy_report", "ambush_king_scouts"]
-        if st.morality >= 40:
-            archetypes += ["rescue_travelers"]
-        if st.morality <= -40:
-            archetypes += ["grim_bargain"]
-        # General exploration
-        archetypes += ["mystic_ruins", "wild_hunt", "whispering_trees"]
-
-        chosen = self.rng.choice(archetypes)
-
-        # Dispatch
-        if chosen == "oath_bond":
-            return self.scene_oath_bond(st)
-        if chosen == "council":
-            return self.scene_council(st)
-        if chosen == "training":
-            return self.scene_training(st)
-        if chosen == "tense_camp":
-            return self.scene_tense_camp(st)
-        if chosen == "spy_report":
-            return self.scene_spy_report(st)
-        if chosen == "ambush_king_scouts":
-            return self.scene_ambush(st)
-        if chosen == "rescue_travelers":
-            return self.scene_rescue(st)
-        if chosen == "grim_bargain":
-            return self.scene_grim_bargain(st)
-        if chosen == "mystic_ruins":
-            return self.scene_ruins(st)
-        if chosen == "wild_hunt":
-            return self.scene_wild_hunt(st)
-        if chosen == "whispering_trees":
-            return self.scene_whispers(st)
-
-        # Fallback generic
-        return self.scene_tense_camp(st)
+        chosen = self.rng.choices(names, weights, k=1)[0]
+
+        # Dispatch (unknown archetypes fall back to a generic camp scene)
+        return self._dispatch.get(chosen, self.scene_tense_camp)(st)
 
     # ----- Scene Implementations -----
 
     def scene_tense_camp(self, st: StoryState):
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.location = "Forest Camp — Ember Clearing"
-        text = (
-            f"A small fire sputters beneath twisted pines. {dl} watches you from across the flames.\n"
-            f"Trust flickers like kindling. The forest listens."
-        )
-        choices = [
-            ("Share a painful memory to earn her empathy.", "camp_confide"),
-            ("Hone your blade in silence; let actions speak.", "camp_silence"),
-            ("Probe her motives—why rule the demons at all?", "camp_probe"),
-            ("Scout the perimeter; danger stalks the dark.", "camp_scout"),
-        ]
-        return text, choices
+        return _TENSE_CAMP_TEXT % dl, _TENSE_CAMP_CHOICES
 
     def scene_training(self, st: StoryState):
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.location = "Obsidian Glade — Training Stones"
-        text = (
-            f"In the Obsidian Glade, {dl} tests you. Demonic sigils fracture the air.\n"
-            f"Power strains your scars as you push beyond mortal limits."
-        )
-        choices = [
-            ("Master a defensive ward to shield the weak.", "train_defense"),
-            ("Channel wrath—strike harder, faster, crueler.", "train_wrath"),
-            ("Synchronize with {dl}'s rhythm; trust the dance of blades.".format(dl=dl), "train_sync"),
-        ]
-        return text, choices
+        return _TRAINING_TEXT % dl, _TRAINING_CHOICES + ((_TRAINING_SYNC_CHOICE % dl, "train_sync"),)
 
     def scene_council(self, st: StoryState):
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.location = "Eclipse Hall — Council of Cinders"
-        text = (
-            f"{dl}'s lieutenants argue under lanterns filled with captured starlight.\n"
-            f"War or peace? Retaliation or secrecy? They seek your counsel."
-        )
-        choices = [
-            ("Advise diplomacy—seek proof of the kingdom's treachery.", "council_diplomacy"),
-            ("Plan raids on corrupt nobles and supply lines.", "council_raids"),
-            ("Propose a secret parley with a sympathetic hero.", "council_parley"),
-        ]
-        return text, choices
+        return _COUNCIL_TEXT % dl, _COUNCIL_CHOICES
 
     def scene_oath_bond(self, st: StoryState):
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.location = "Moonwell — Mirror of Vows"
-        text = (
-            f"Beside the Moonwell, {dl} offers her hand. \"We choose each other—against crown and fate.\"\n"
-            f"The water reflects futures you barely recognize."
-        )
-        choices = [
-            ("Swear an oath of alliance.", "oath_sworn"),
-            ("Hesitate—the cost of vows is always hidden.", "oath_hesitate"),
-            ("Refuse—freedom above all.", "oath_refuse"),
-        ]
-        return text, choices
+        return _OATH_BOND_TEXT % dl, _OATH_BOND_CHOICES
 
     def scene_spy_report(self, st: StoryState):
         st.location = "Shadespine — Scout's Path"
-        text = (
-            "A demon scout kneels, breathless: the kingdom moves hunters into the forest.\n"
-            "They bear your crest—bait for a public execution."
-        )
-        choices = [
-            ("Intercept and expose the ruse.", "spy_intercept"),
-            ("Turn the ambush onto the hunters.", "spy_reverse"),
-            ("Ignore; focus on power first.", "spy_ignore"),
-        ]
-        return text, choices
+        return _SPY_REPORT_TEXT, _SPY_REPORT_CHOICES
 
     def scene_ambush(self, st: StoryState):
         st.location = "Ravine Verge — Broken Bridge"
-        text = (
-            "You spot royal scouts across a broken bridge, whispering your name like a curse.\n"
-            "Their signal mirrors glint. A choice, sharp as shale."
-        )
-        choices = [
-            ("Strike from shadow—no witnesses.", "ambush_shadow"),
-            ("Seize a scout alive for information.", "ambush_capture"),
-            ("Let them flee; plant fear and rumor.", "ambush_letgo"),
-        ]
-        return text, choices
+        return _AMBUSH_TEXT, _AMBUSH_CHOICES
 
     def scene_rescue(self, st: StoryState):
         st.location = "Cairn Road — Bleak Mile"
-        text = (
-            "A caravan of refugees stumbles under the weight of injustice. Bandits circle.\n"
-            "You hear a child's cough beneath the wind."
-        )
-        choices = [
-            ("Shield the caravan; take the blows for them.", "rescue_shield"),
-            ("Outwit the bandits with a ruse.", "rescue_ruse"),
-            ("Walk away. Mercy is a luxury.", "rescue_walk"),
-        ]
-        return text, choices
+        return _RESCUE_TEXT, _RESCUE_CHOICES
 
     def scene_grim_bargain(self, st: StoryState):
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.location = "Thorn Altar — Price of Power"
-        text = (
-            f"A thorned altar hums with forbidden strength. {dl}'s gaze is unreadable.\n"
-            "The altar grants might… and takes what you value most."
-        )
-        choices = [
-            ("Bleed for power: sacrifice a memory.", "bargain_memory"),
-            ("Spare yourself—reject the altar.", "bargain_reject"),
-            ("Offer the altar a token from your betrayers.", "bargain_token"),
-        ]
-        return text, choices
+        return _GRIM_BARGAIN_TEXT % dl, _GRIM_BARGAIN_CHOICES
 
     def scene_ruins(self, st: StoryState):
         st.location = "Ancient Ruins — Vault of Mists"
-        text = (
-            "Fog curls around cracked archways. Glyphs speak of heroes who burned their own ages ago.\n"
-            "A vault door breathes cold secrets."
-        )
-        choices = [
-            ("Study the glyphs for hidden history.", "ruins_study"),
-            ("Force the vault—whatever lies within is yours.", "ruins_force"),
-            ("Leave a mark: a promise to return stronger.", "ruins_mark"),
-        ]
-        return text, choices
+        return _RUINS_TEXT, _RUINS_CHOICES
 
     def scene_wild_hunt(self, st: StoryState):
         st.location = "Night Plains — The Wild Hunt"
-        text = (
-            "Horns sound. Spectral riders rise like storm-surf, seeking a worthy quarry.\n"
-            "They circle, inviting chase or challenge."
-        )
-        choices = [
-            ("Race with them; learn their paths.", "hunt_race"),
-            ("Challenge the huntmaster to single combat.", "hunt_duel"),
-            ("Hide and observe; knowledge first.", "hunt_hide"),
-        ]
-        return text, choices
+        return _WILD_HUNT_TEXT, _WILD_HUNT_CHOICES
 
     def scene_whispers(self, st: StoryState):
+        dl = st.demon_lord_name()
         st.location = "Whispering Trees — Root of Echoes"
-        text = (
-            "Leaves speak in voices you once trusted. They tell different truths now.\n"
-            "One whisper carries the name of a hero who betrayed you."
-        )
-        choices = [
-            ("Follow the whisper to its source.", "whisper_follow"),
-            ("Silence the voices with a ward.", "whisper_ward"),
-            ("Ask {dl} to listen with you.".format(dl=st.flags.get('demon_lord_name', 'the Demon Lord')), "whisper_together"),
-        ]
-        return text, choices
+        return _WHISPERS_TEXT, _WHISPERS_CHOICES + ((_WHISPERS_TOGETHER_CHOICE % dl, "whisper_together"),)
 
     # ----- Apply Choice Effects & Generate Continuation Text -----
 
     def apply_choice(self, st: StoryState, tag: str) -> str:
-        # Modifiers helper
-        def mod(attr, delta, lo, hi):
-            setattr(st, attr, self.clamp(getattr(st, attr) + delta, lo, hi))
-
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         st.chapter += 1
 
-        # Map tags to effects & narration snippets
-        # Intro
-        if tag == "intro_plead":
-            mod("morality", +10, -100, 100)
-            mod("trust_demon_lord", +15, 0, 100)
-            st.flags["seeking_truth"] = True
-            return f"You speak plainly of betrayal. {dl} studies the cracks in your voice and lowers her hand. \"Truth cuts deeper than any blade,\" she says."
-        if tag == "intro_vengeance":
-            mod("morality", -10, -100, 100)
-            mod("power", +10, 0, 100)
-            st.flags["vow_revenge"] = True
-            mod("trust_demon_lord", +5, 0, 100)
-            return f"Vengeance burns like pitch. {dl} smiles—a small, dangerous thing. \"Then we understand each other.\""
-        if tag == "intro_pact":
-            mod("trust_demon_lord", +20, 0, 100)
-            st.flags["allied"] = True
-            return f"You offer terms, not supplication. {dl} clasps your wrist. \"We hunt different prey—but we can share the trail.\""
-        if tag == "intro_fight":
-            mod("health", -15, 0, 100)
-            mod("power", +5, 0, 100)
-            mod("trust_demon_lord", +10, 0, 100)  # Respect through defiance
-            return f"Steel rings. You draw blood and pay in kind. {dl} laughs like thunder far away. \"Live, then. Earn the right to stand.\""
-
-        # Camp
-        if tag == "camp_confide":
-            mod("morality", +5, -100, 100)
-            mod("trust_demon_lord", +12, 0, 100)
-            return f"Your memory is a splinter. You let it out. {dl} listens without mercy—without judgment. The fire warms, just a little."
-        if tag == "camp_silence":
-            mod("power", +5, 0, 100); mod("trust_demon_lord", +2, 0, 100)
-            return "You sharpen steel and silence. Sparks chart constellations no map has named."
-        if tag == "camp_probe":
-            mod("trust_demon_lord", -3, 0, 100); mod("notoriety", +5, 0, 100)
-            return f"Questions are knives. {dl} answers some and turns aside others. You learn enough to be wary—and useful."
-        if tag == "camp_scout":
-            mod("power", +3, 0, 100); mod("health", +3, 0, 100)
-            return "You pace the warding ring. Footprints. A bent reed. The forest is a chessboard and you are learning the moves."
-
-        # Training
-        if tag == "train_defense":
-            mod("power", +7, 0, 100); mod("morality", +5, -100, 100); mod("trust_demon_lord", +5, 0, 100)
-            return "Your ward blooms like a quiet star. It holds when claws descend. Somewhere, someone will live because of this."
-        if tag == "train_wrath":
-            mod("power", +12, 0, 100); mod("morality", -6, -100, 100); mod("notoriety", +6, 0, 100)
-            return "You inhale the storm and exhale ruin. The stones remember your name as a crack."
-        if tag == "train_sync":
-            mod("power", +6, 0, 100); mod("trust_demon_lord", +10, 0, 100); st.bond_demon_lord = self.clamp(st.bond_demon_lord + 1, 0, 100)
-            return f"Step, strike, breathe—together. {dl}'s motion becomes a language you begin to read."
-
-        # Council
-        if tag == "council_diplomacy":
-            mod("morality", +8, -100, 100); mod("trust_demon_lord", +6, 0, 100)
-            st.flags["seeking_truth"] = True
-            return "You chart a path of proof and patience. The hall quiets; even war can listen."
-        if tag == "council_raids":
-            mod("power", +8, 0, 100); mod("notoriety", +10, 0, 100); st.flags["vow_revenge"] = True
-            return "Targets line the map like sins. You thread a needle through them made of fire."
-        if tag == "council_parley":
-            mod("morality", +3, -100, 100); mod("notoriety", +3, 0, 100); st.flags["parley_set"] = True
-            return "A secret parley—dangerous, delicate. If it holds, the story changes."
-
-        # Oath
-        if tag == "oath_sworn":
-            mod("trust_demon_lord", +20, 0, 100); st.flags["oath_bound"] = True; st.bond_demon_lord = self.clamp(st.bond_demon_lord + 3, 0, 100)
-            return "You swear by fang and star. The Moonwell seals the promise with a chill that tastes like dawn."
-        if tag == "oath_hesitate":
-            mod("trust_demon_lord", -5, 0, 100)
-            return "You ask for time. The Moonwell reflects two strangers trying to be allies."
-        if tag == "oath_refuse":
-            mod("trust_demon_lord", -12, 0, 100); st.flags["allied"] = False
-            return "You step back from the brink. Freedom is a lonely country."
-
-        # Spies & Ambush
-        if tag == "spy_intercept":
-            mod("morality", +4, -100, 100); mod("notoriety", +5, 0, 100)
-            return "You unmask the trap and free the bait. Rumors begin to turn toward truth."
-        if tag == "spy_reverse":
-            mod("power", +7, 0, 100); mod("morality", -2, -100, 100); mod("notoriety", +9, 0, 100)
-            return "Hunters become the hunted. The forest keeps your secrets."
-        if tag == "spy_ignore":
-            mod("power", +4, 0, 100); mod("morality", -4, -100, 100)
-            return "You let the game play on without you—for now."
-
-        if tag == "ambush_shadow":
-            mod("power", +8, 0, 100); mod("morality", -6, -100, 100); mod("notoriety", +8, 0, 100)
-            return "No witnesses. No mercy. The bridge remembers only silence."
-        if tag == "ambush_capture":
-            mod("morality", +6, -100, 100); mod("notoriety", +4, 0, 100)
-            return "Under your blade, a scout chooses life—and answers. Names spill like beads from a torn chain."
-        if tag == "ambush_letgo":
-            mod("morality", +2, -100, 100); mod("notoriety", +6, 0, 100)
-            return "Mercy travels faster than hoofbeats. Fear travels faster still."
-
-        # Rescue
-        if tag == "rescue_shield":
-            mod("morality", +10, -100, 100); mod("health", -8, 0, 100); mod("trust_demon_lord", +4, 0, 100)
-            return "You take the blows others could not bear. A child's cough becomes a laugh."
-        if tag == "rescue_ruse":
-            mod("morality", +6, -100, 100); mod("power", +3, 0, 100)
-            return "Illusions, footprints, a staged cry—bandits chase ghosts while the caravan slips free."
-        if tag == "rescue_walk":
-            mod("morality", -10, -100, 100); mod("power", +4, 0, 100); mod("notoriety", +5, 0, 100)
-            return "You turn away. The road learns your name without deciding if it loves you."
-
-        # Grim bargain
-        if tag == "bargain_memory":
-            mod("power", +15, 0, 100); mod("morality", -8, -100, 100)
-            st.history.append("You traded a cherished memory at the Thorn Altar.")
-            return "You give the altar a memory of home. Power rushes in to fill the hollow it leaves."
-        if tag == "bargain_reject":
-            mod("morality", +5, -100, 100); mod("trust_demon_lord", +3, 0, 100)
-            return "You walk away from easy strength. The altar hums, disappointed."
-        if tag == "bargain_token":
-            mod("power", +10, 0, 100); mod("notoriety", +7, 0, 100)
-            return "You place a betrayer's token on the altar. The thorns drink deep and answer with power."
-
-        # Ruins
-        if tag == "ruins_study":
-            mod("power", +4, 0, 100); mod("morality", +2, -100, 100)
-            st.history.append("Discovered records of prior heroes consumed by their crowns.")
-            return "Glyphs confess: heroes burned an age to keep a throne warm. Truth is an ember you pocket."
-        if tag == "ruins_force":
-            mod("power", +8, 0, 100); mod("morality", -4, -100, 100)
-            st.inventory.append("Vault Relic"); st.inventory = list(dict.fromkeys(st.inventory))
-            return "The vault yields with a scream of stone. Inside waits a relic that knows your pulse."
-        if tag == "ruins_mark":
-            mod("morality", +1, -100, 100); mod("trust_demon_lord", +2, 0, 100)
-            return "You leave a mark, not a wound. Even ruins deserve a future."
-
-        # Wild Hunt
-        if tag == "hunt_race":
-            mod("power", +5, 0, 100); mod("notoriety", +3, 0, 100)
-            return "You run with ghosts until your lungs are bells. They teach you shortcuts through moonlight."
-        if tag == "hunt_duel":
-            mod("power", +10, 0, 100); mod("health", -6, 0, 100); mod("notoriety", +6, 0, 100)
-            return "Steel rings against antler and oath. You win a scar and a salute."
-        if tag == "hunt_hide":
-            mod("morality", +2, -100, 100)
-            return "You watch unseen as the Wild Hunt redraws the night's borders."
-
-        # Whispers
-        if tag == "whisper_follow":
-            mod("notoriety", +4, 0, 100)
-            st.flags["betrayer_trail"] = True
-            return "The whisper leads to a sigil cut in bark: a hero's mark. The trail warms under your gaze."
-        if tag == "whisper_ward":
-            mod("power", +3, 0, 100); mod("morality", +1, -100, 100)
-            return "You hush the forest with a ward that tastes like peppermint and thunder."
-        if tag == "whisper_together":
-            mod("trust_demon_lord", +8, 0, 100); st.bond_demon_lord = self.clamp(st.bond_demon_lord + 1, 0, 100)
-            return f"You and {dl} listen as one. The voices braid into a map only two can read."
-
-        # Unknown tag fallback
-        return "Time moves, yet nothing decisive happens. Perhaps the next choice will cut deeper."
+        eff = _EFFECTS.get(tag)
+        if eff is None:
+            # Unknown tag fallback
+            return "Time moves, yet nothing decisive happens. Perhaps the next choice will cut deeper."
+
+        for attr, delta, lo, hi in eff["deltas"]:
+            v = getattr(st, attr) + delta
+            if v < lo:
+                v = lo
+            elif v > hi:
+                v = hi
+            setattr(st, attr, v)
+        st.flags.update(eff.get("flags", {}))
+        if "history" in eff:
+            st.history.append(eff["history"])
+        item = eff.get("item")
+        if item and item not in st.inventory:
+            st.inventory.append(item)
+        return eff["text"].format(dl=dl)
 
     # ----- Ending checks -----
     def check_ending(self, st: StoryState) -> Optional[str]:
         """Return ending text if conditions met, else None."""
-        dl = st.flags.get("demon_lord_name", "the Demon Lord")
+        dl = st.demon_lord_name()
         if st.health <= 0:
             return "Your story ends beneath black boughs. Even the forest bows its head."
         # Ascendant Alliance
@@ -567,25 +767,45 @@ class StoryEngine:
 # ---------- IO & Game Loop ----------
 
 def prompt(msg: str) -> str:
+    """Show msg and read one line; raises EOFError at end of input, like input()."""
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def _drain_stdin():
+    """Discard lines typed ahead while output was printing, so each prompt reads a fresh answer."""
+    # Piped/scripted input is meant to be consumed in order; only flush a terminal.
+    if not sys.stdin.isatty():
+        return
     try:
-        return input(msg)
-    except EOFError:
-        return "quit"
+        import termios
+    except ImportError:  # Windows
+        import msvcrt
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+    else:
+        termios.tcflush(sys.stdin, termios.TCIFLUSH)
 
 def print_stats(st: StoryState):
-    print("\n--- Stats ---")
-    print(f"Name: {st.name} | Chapter: {st.chapter} | Location: {st.location}")
-    print(f"Health: {st.health}  Power: {st.power}  Morality: {st.morality}  Notoriety: {st.notoriety}")
-    print(f"Trust (Demon Lord): {st.trust_demon_lord}  Bond: {st.bond_demon_lord}")
-    print(f"Inventory: {', '.join(st.inventory) if st.inventory else '(empty)'}")
+    # Built as one block so the stats go out in a single write
+    lines = [
+        "\n--- Stats ---",
+        f"Name: {st.name} | Chapter: {st.chapter} | Location: {st.location}",
+        f"Health: {st.health}  Power: {st.power}  Morality: {st.morality}  Notoriety: {st.notoriety}",
+        f"Trust (Demon Lord): {st.trust_demon_lord}  Bond: {st.bond_demon_lord}",
+        f"Inventory: {', '.join(st.inventory) if st.inventory else '(empty)'}",
+    ]
     if st.flags:
         key_flags = [k for k, v in st.flags.items() if v]
         if key_flags:
-            print(f"Notable Flags: {', '.join(sorted(key_flags))}")
-    print("-------------\n")
+            lines.append(f"Notable Flags: {', '.join(sorted(key_flags))}")
+    lines.append("-------------\n\n")
+    sys.stdout.write("\n".join(lines))
 
-def show_help():
-    print(dedent("""
+_HELP_TEXT = dedent("""
     Commands you can type anytime:
       help           - show this help
       stats          - show your current stats
@@ -593,27 +813,50 @@ def show_help():
       load <slot>    - load from slot 1-8 (e.g., load 2)
       slots          - list existing saves
       quit           - exit the game
-    """))
+    """)
+
+def show_help():
+    print(_HELP_TEXT)
+
+_NOARG_CMDS = frozenset({"help", "stats", "slots", "quit"})
+_ARG_CMDS = frozenset({"save", "load"})
 
 def parse_command(s: str) -> Tuple[str, Optional[int]]:
     parts = s.strip().lower().split()
     if not parts:
         return "", None
-    if parts[0] in {"help","stats","slots","quit"}:
-        return parts[0], None
-    if parts[0] in {"save", "load"}:
+    cmd = parts[0]
+    if cmd in _NOARG_CMDS:
+        return cmd, None
+    if cmd in _ARG_CMDS:
         if len(parts) >= 2 and parts[1].isdigit():
-            return parts[0], int(parts[1])
-        else:
-            return parts[0], None
+            return cmd, int(parts[1])
+        return cmd, None
     return "", None
 
-def game_loop(state: StoryState):
-    rng = random.Random(state.seed)
-    engine = StoryEngine(rng)
-    saver = SaveManager()
+def save_report(slot: int, fut: Future) -> str:
+    err = fut.exception()
+    if err is not None:
+        return f"Save failed: {err}"
+    return f"Saved to Slot {slot} ({fut.result()})"
 
-    print(ascii_title())
+def game_loop(state: StoryState, saver: SaveManager):
+    rng = random.Random()
+    state.restore_rng(rng)
+    engine = StoryEngine(rng)
+    # Background saves finish on other threads; their done-callbacks only queue
+    # a message, which this thread prints before the next prompt so it never
+    # lands on the line the player is typing.
+    save_reports: queue.SimpleQueue[str] = queue.SimpleQueue()
+    unreported = 0
+
+    def show_save_reports(wait: bool = False):
+        nonlocal unreported
+        while unreported and (wait or not save_reports.empty()):
+            print(save_reports.get())
+            unreported -= 1
+
+    print(_ASCII_TITLE)
     print("You can type 'help' at any time.\n")
     show_help()
 
@@ -624,21 +867,28 @@ def game_loop(state: StoryState):
             print("\n=== An Ending Unfolds ===")
             print(ending)
             print("\nThanks for playing A Game Of Lore.\n")
+            show_save_reports(wait=True)
             return
 
         # Generate scene
         text, choices = engine.generate_scene(state)
-        print(f"\n[Chapter {state.chapter}] {state.location}")
-        print("\n" + text + "\n")
-
-        # Display choices
+        # Scene and choices go out as one block
+        out = [f"\n[Chapter {state.chapter}] {state.location}\n", "\n" + text + "\n\n"]
         for i, (ctext, _) in enumerate(choices, start=1):
-            print(f"  {i}. {ctext}")
-        print("  (Or type a command: save <n>, load <n>, stats, slots, help, quit)")
+            out.append(f"  {i}. {ctext}\n")
+        out.append("  (Or type a command: save <n>, load <n>, stats, slots, help, quit)\n")
+        sys.stdout.write("".join(out))
+        # Typed choice number -> index into choices
+        choice_index = {str(i): i - 1 for i in range(1, len(choices) + 1)}
 
         # Read input
         while True:
-            raw = prompt("\nYour choice: ").strip()
+            show_save_reports()
+            _drain_stdin()
+            try:
+                raw = prompt("\nYour choice: ").strip()
+            except EOFError:
+                raw = "quit"
             cmd, slot = parse_command(raw)
             if cmd:
                 if cmd == "help":
@@ -648,62 +898,73 @@ def game_loop(state: StoryState):
                     print_stats(state); continue
                 if cmd == "slots":
                     saves = saver.list_saves()
+                    # list_saves() waited for pending saves; confirm them before listing
+                    show_save_reports(wait=True)
                     if not saves:
-                        print("No saves yet. Use: save <slot> (1-8)")
+                        out = "No saves yet. Use: save <slot> (1-8)\n"
                     else:
-                        print("Existing saves:")
-                        for s, ts in saves:
-                            print(f"  Slot {s}: {ts}")
+                        out = "Existing saves:\n" + "".join(f"  Slot {s}: {ts}\n" for s, ts in saves)
+                    sys.stdout.write(out)
                     continue
                 if cmd == "quit":
+                    show_save_reports(wait=True)
                     print("Farewell, traveler.")
                     return
                 if cmd == "save":
                     if slot is None:
                         print("Usage: save <slot number 1-8>"); continue
+                    state.capture_rng(rng)
                     try:
-                        path = saver.save(slot, state)
-                        print(f"Saved to Slot {slot} ({path})")
+                        fut = saver.save_async(slot, state)
                     except Exception as e:
-                        print(f"Save failed: {e}")
+                        print(f"Save failed: {e}"); continue
+                    print(f"Saving to Slot {slot}…")
+                    unreported += 1
+                    fut.add_done_callback(lambda f, slot=slot: save_reports.put(save_report(slot, f)))
                     continue
                 if cmd == "load":
                     if slot is None:
                         print("Usage: load <slot number 1-8>"); continue
                     try:
-                        state = saver.load(slot)
-                        rng.seed(state.seed)
+                        # Only switch over once the whole save, RNG included, is usable
+                        loaded = saver.load(slot)
+                        # load() waited for pending saves; confirm them before loading output
+                        show_save_reports(wait=True)
+                        loaded.restore_rng(rng)
+                        state = loaded
                         print(f"Loaded Slot {slot}.")
                         print_stats(state)
                     except Exception as e:
+                        show_save_reports(wait=True)
                         print(f"Load failed: {e}")
                     continue
 
             # Not a command: try numeric choice
-            if raw.isdigit():
-                idx = int(raw)
-                if 1 <= idx <= len(choices):
-                    _, tag = choices[idx - 1]
-                    follow = engine.apply_choice(state, tag)
-                    print("\n" + follow + "\n")
-                    # Incidental attr drift to keep story lively
-                    if engine._p(0.15):
-                        state.health = engine.clamp(state.health + rng.choice([-2, -1, +1, +2]), 0, 100)
-                    break
-                else:
-                    print("Pick a listed choice number.")
+            # Leading zeros are accepted, as int(raw) did ("01" picks choice 1)
+            idx = choice_index.get(raw.lstrip("0"))
+            if idx is not None:
+                _, tag = choices[idx]
+                follow = engine.apply_choice(state, tag)
+                print("\n" + follow + "\n")
+                # Incidental attr drift to keep story lively
+                if rng.random() < 0.15:
+                    state.health = max(0, min(100, state.health + rng.choice([-2, -1, +1, +2])))
+                break
+            elif raw.isdigit():
+                print("Pick a listed choice number.")
             else:
                 print("Type a choice number, or a command like 'save 1' or 'help'.")
 
 def new_game() -> StoryState:
-    print(ascii_title())
+    print(_ASCII_TITLE)
     print("Welcome to A Game Of Lore.\n")
-    name = input("What name shall your legend carry? ").strip()
+    name = prompt("What name shall your legend carry? ").strip()
     if not name:
         name = "Nameless"
     # Deterministic-ish seed from name + time
+    # (a 32-bit checksum is plenty to seed random; no need for a crypto hash)
     seed_src = f"{name}-{time.time()}".encode("utf-8")
-    seed = int(hashlib.sha256(seed_src).hexdigest(), 16) % (2**32)
+    seed = zlib.crc32(seed_src)
     st = StoryState(name=name, seed=seed)
     st.flags = {
         "betrayed": True,
@@ -713,31 +974,40 @@ def new_game() -> StoryState:
     }
     return st
 
+# Main menu input -> action
+_MENU_ACTIONS = {
+    **dict.fromkeys(("1", "n", "new", "new game"), "new"),
+    **dict.fromkeys(("2", "l", "load", "load game"), "load"),
+    **dict.fromkeys(("3", "q", "quit", "exit"), "quit"),
+}
+
 def main():
     saver = SaveManager()
     while True:
-        print(ascii_title())
+        _drain_stdin()
+        print(_ASCII_TITLE)
         print("1) New Game")
         print("2) Load Game")
         print("3) Quit")
-        choice = input("\nSelect: ").strip()
-        cl = choice.strip().lower()
-        if cl in ("1", "n", "new", "new game"):
+        action = _MENU_ACTIONS.get(prompt("\nSelect: ").strip().lower())
+        if action == "new":
             state = new_game()
-            game_loop(state)
-        elif cl in ("2", "l", "load", "load game"):
-            print("Enter slot number (1-8): ", end="")
-            slot = input().strip()
+            game_loop(state, saver)
+        elif action == "load":
+            # Slot files load from cache while the player is still typing the number
+            saver.prefetch()
+            slot = prompt("Enter slot number (1-8): ").strip()
             if slot.isdigit():
                 try:
                     state = saver.load(int(slot))
-                    game_loop(state)
+                    game_loop(state, saver)
                 except Exception as e:
                     print(f"Could not load: {e}")
-                    input("Press Enter to continue...")
+                    prompt("Press Enter to continue...")
             else:
                 print("Invalid slot.")
-        elif cl in ("3", "q", "quit", "exit"):
+        elif action == "quit":
+            saver.close()
             print("Goodbye.")
             return
         else: